@@ -1,4 +1,47 @@
-from .client import *
-from .contex import *
-from .dpy_overrides import *
-from .const import *
\ No newline at end of file
+from importlib import import_module
+
+from .const import __version__
+from .patches import PATCHES, install
+
+# Submodules are imported on first attribute access, so importing the package
+# does not pull in discord_slash or discord_components until they are used.
+_LAZY = {
+    "SlashCommand": ".client",
+    "CustomIdCodec": ".codec",
+    "InvalidCustomId": ".codec",
+    "ComponentContext": ".contex",
+    "OriginMessageCache": ".contex",
+    "ComponentMessage": ".dpy_overrides",
+    "send_override": ".dpy_overrides",
+    "fetch_message": ".dpy_overrides",
+    "SlashMessage": ".model",
+    "InteractionRecorder": ".replay",
+    "InteractionReplayer": ".replay",
+    "StubDiscordServer": ".replay",
+    "InteractionTransport": ".transport",
+    "RequestTiming": ".transport",
+    "ComponentTimeoutManager": ".timeouts",
+    "component_snapshot": ".offload",
+    "Paginator": ".paginator",
+    "PageSource": ".paginator",
+    "broadcast": ".broadcast",
+    "BroadcastResult": ".broadcast",
+    "InteractionMessageHandle": ".handles",
+    "HandleStore": ".handles",
+}
+
+__all__ = ["PATCHES", "install", "__version__", *_LAZY]
+
+
+def __getattr__(name):
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return __all__
@@ -0,0 +1,127 @@
+import asyncio
+from collections import defaultdict
+from typing import TYPE_CHECKING, AsyncIterator, Iterable, List, Union
+
+from aiohttp.payload import BytesPayload
+from discord import AllowedMentions, Embed, utils
+from discord.abc import Messageable
+from discord.http import Route
+
+from .dpy_overrides import ComponentMessage
+from .utils import _get_components_json
+
+if TYPE_CHECKING:
+    from discord_components import Component, ActionRow
+
+
+class BroadcastResult:
+    """
+    Result of sending to one channel.
+
+    :ivar channel: The channel.
+    :ivar message: Sent :class:`ComponentMessage`, raw message data if ``parse`` was ``False``, or ``None`` on failure.
+    :ivar error: Exception raised by the send or ``None``.
+    """
+
+    __slots__ = ("channel", "message", "error")
+
+    def __init__(self, channel, message=None, error: Exception = None):
+        self.channel = channel
+        self.message = message
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self):
+        return f"<BroadcastResult channel={self.channel!r} ok={self.ok} error={self.error!r}>"
+
+
+async def broadcast(
+    channels: Iterable[Messageable],
+    content: str = None,
+    *,
+    embed: Embed = None,
+    components: List[Union["ActionRow", "Component", List["Component"]]] = None,
+    tts: bool = False,
+    allowed_mentions: AllowedMentions = None,
+    concurrency: int = 10,
+    per_bucket: int = 1,
+    parse: bool = True,
+) -> AsyncIterator[BroadcastResult]:
+    """
+    Sends the same message to many channels.
+
+    The payload is serialized once and the same bytes are sent to every channel.
+    Sends run concurrently, at most ``concurrency`` at a time and ``per_bucket`` per channel,
+    and results are yielded as they complete. A failed send doesn't stop the others.
+
+    Example:
+
+    .. code-block:: python
+
+        async for result in broadcast(channels, "Update is out!", components=[...]):
+            if not result.ok:
+                print(f"Failed to send to {result.channel}: {result.error}")
+
+    :param channels: Channels to send to.
+    :param content: Content of the message.
+    :param embed: Embed of the message.
+    :param components: Components of the message.
+    :param tts: Whether to speak the message using tts.
+    :param allowed_mentions: Merged with :attr:`discord.Client.allowed_mentions` like in ``send``.
+    :param concurrency: Maximum number of simultaneous requests.
+    :param per_bucket: Maximum number of simultaneous requests to one channel.
+    :param parse: Whether to build :class:`ComponentMessage` objects from the responses.
+    """
+    channels = list(channels)
+    if not channels:
+        return
+    state = channels[0]._state
+
+    if allowed_mentions is not None:
+        if state.allowed_mentions is not None:
+            allowed_mentions = state.allowed_mentions.merge(allowed_mentions).to_dict()
+        else:
+            allowed_mentions = allowed_mentions.to_dict()
+    else:
+        allowed_mentions = state.allowed_mentions and state.allowed_mentions.to_dict()
+
+    payload = {}
+    if content is not None:
+        payload["content"] = str(content)
+    if tts:
+        payload["tts"] = True
+    if embed is not None:
+        payload["embed"] = embed.to_dict()
+    if components:
+        payload["components"] = _get_components_json(components)
+    if allowed_mentions:
+        payload["allowed_mentions"] = allowed_mentions
+    body = utils.to_json(payload).encode()
+
+    semaphore = asyncio.Semaphore(concurrency)
+    buckets = defaultdict(lambda: asyncio.Semaphore(per_bucket))
+
+    async def send_one(destination) -> BroadcastResult:
+        try:
+            channel = await destination._get_channel()
+            route = Route("POST", "/channels/{channel_id}/messages", channel_id=channel.id)
+            async with buckets[channel.id], semaphore:
+                data = await state.http.request(
+                    route, data=BytesPayload(body, content_type="application/json")
+                )
+        except Exception as ex:
+            return BroadcastResult(destination, error=ex)
+        if parse:
+            data = ComponentMessage(state=state, channel=channel, data=data)
+        return BroadcastResult(destination, data)
+
+    tasks = [asyncio.ensure_future(send_one(channel)) for channel in channels]
+    try:
+        for future in asyncio.as_completed(tasks):
+            yield await future
+    finally:
+        for task in tasks:
+            task.cancel()
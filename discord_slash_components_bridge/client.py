@@ -1,23 +1,114 @@
-from discord_slash import SlashCommand as _SlashCommand
-from discord_components import InteractionEventType, Component
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Iterable, Optional, Union
 
+from discord_slash import SlashCommand as _SlashCommand, error
+
+from .codec import CustomIdCodec, InvalidCustomId
 from .contex import ComponentContext
+from .offload import ExecutorPool, offloaded
+from .patches import install
+from .transport import InteractionRequest, InteractionTransport
+
+if TYPE_CHECKING:
+    from discord_components import Component
 
 
 class SlashCommand(_SlashCommand):
     _components_callback = {}
+    _component_events = None
+    recorder = None
+
+    def __init__(
+        self,
+        client,
+        *args,
+        patches: Optional[Iterable[str]] = None,
+        codec: Optional[CustomIdCodec] = None,
+        transport: Optional[InteractionTransport] = None,
+        **kwargs
+    ):
+        """
+        :param patches: Names of the overrides to install, see :func:`install`. All of them by default.
+        :type patches: Optional[Iterable[str]]
+        :param codec: Codec of custom ids which are routed to :meth:`component_handler` handlers.
+        :type codec: Optional[CustomIdCodec]
+        :param transport: Dedicated HTTP transport for interaction responses. discord.py's session is used if not set.
+        :type transport: Optional[InteractionTransport]
+        """
+        install(patches)
+        super().__init__(client, *args, **kwargs)
+        self.codec = codec
+        self._component_handlers = {}
+        self.executors = ExecutorPool()
+
+        self.transport = transport
+        if transport is not None:
+            self.req = InteractionRequest(
+                self.logger, self._discord, self.req._application_id, transport
+            )
+            self._transport_start = self._discord.loop.create_task(transport.start())
+        self._close_with_client()
+
+    def _close_with_client(self):
+        """Closes the transport and shuts the executors down when the client is closed."""
+        client = self._discord
+        close = client.close
+
+        async def close_with_bridge(*args, **kwargs):
+            try:
+                await close(*args, **kwargs)
+            finally:
+                # Don't block the loop, workers exit when their current calls finish.
+                self.executors.shutdown(wait=False)
+                if self.transport is not None:
+                    if not self._transport_start.done():
+                        self._transport_start.cancel()
+                    await self.transport.close()
+
+        client.close = close_with_bridge
 
+    def _has_listeners(self, event: str) -> bool:
+        """Whether dispatching ``event`` would reach a waiter, an ``on_`` handler or a listener."""
+        client = self._discord
+        if client._listeners.get(event):
+            return True
+        method = "on_" + event
+        if hasattr(client, method):
+            return True
+        extra_events = getattr(client, "extra_events", None)
+        return bool(extra_events and extra_events.get(method))
+
+    def _dispatch(self, event: str, *args):
+        if self._has_listeners(event):
+            self._discord.dispatch(event, *args)
+
+    @classmethod
+    def _get_component_events(cls, component_type: int):
+        if cls._component_events is None:
+            from discord_components import InteractionEventType
+
+            cls._component_events = {
+                _type.value: (f"raw_{_type.name}", _type.name) for _type in InteractionEventType
+            }
+        return cls._component_events.get(component_type)
 
     async def _on_component(self, to_use):
+        if self.recorder is not None:
+            self.recorder.record("INTERACTION_CREATE", to_use)
+
         ctx = ComponentContext(self.req, to_use, self._discord, self.logger)
-        self._discord.dispatch("component", ctx)
+        self._dispatch("component", ctx)
+
+        # stateless handler encoded in custom_id
+        if self.codec is not None and self.codec.is_encoded(ctx.custom_id):
+            await self._invoke_component_handler(ctx)
 
         # discord-interactions callback
         callback = self.get_component_callback(
             ctx.origin_message_id, ctx.custom_id, ctx.component_type
         )
         if callback is not None:
-            self._discord.dispatch("component_callback", ctx, callback)
+            self._dispatch("component_callback", ctx, callback)
             await self.invoke_component_callback(callback, ctx)
 
         # discord-components callback
@@ -34,13 +125,40 @@ class SlashCommand(_SlashCommand):
 
             await self._components_callback[ctx.custom_id]["callback"](ctx)
 
-        for _type in InteractionEventType:
-            if _type.value == to_use["data"]["component_type"]:
-                self._discord.dispatch(f"raw_{_type.name}", to_use)
-                self._discord.dispatch(_type.name, ctx)
-                break
+        events = self._get_component_events(ctx.component_type)
+        if events is not None:
+            raw_event, event = events
+            self._dispatch(raw_event, to_use)
+            self._dispatch(event, ctx)
+
+    def add_callback(
+        self,
+        component: "Component",
+        callback,
+        *,
+        uses: int = None,
+        filter=None,
+        executor: Union[str, Executor] = None,
+        respond: str = "edit_origin",
+    ):
+        """
+        Registers a callback for the component's custom id.
 
-    def add_callback(self, component: Component, callback, *, uses: int = None, filter=None):
+        :param component: Component to register the callback for.
+        :type component: Component
+        :param callback: Coroutine callback, or a sync function if ``executor`` is set.
+        :param uses: How many times the callback can be called. Unlimited if ``None``.
+        :type uses: int
+        :param filter: Function which gets the context and returns whether to call the callback.
+        :param executor: ``"thread"``, ``"process"`` or an :class:`~concurrent.futures.Executor` to run
+            the sync ``callback`` in. It is called with :func:`component_snapshot` data and returns
+            the fields of the response, see :func:`run_offloaded`.
+        :type executor: Union[str, Executor]
+        :param respond: Whether the offloaded result is sent with ``"edit_origin"`` or ``"send"``.
+        :type respond: str
+        """
+        if executor is not None:
+            callback = offloaded(self.executors, callback, executor, respond)
         self._components_callback[component.custom_id] = {
             "callback": callback,
             "uses": uses,
@@ -48,3 +166,104 @@ class SlashCommand(_SlashCommand):
         }
         return component
 
+    def add_component_handler(
+        self,
+        callback,
+        *,
+        name: str = None,
+        executor: Union[str, Executor] = None,
+        respond: str = "edit_origin",
+    ):
+        """
+        Registers a handler for custom ids made by :meth:`encode_custom_id`.
+        The handler is called with the context and the decoded arguments.
+
+        :param callback: Coroutine handler, or a sync function if ``executor`` is set.
+        :param name: Name of the handler. Name of the callback by default.
+        :type name: str
+        :param executor: Executor to run the sync handler in, see :meth:`add_callback`.
+        :type executor: Union[str, Executor]
+        :param respond: Whether the offloaded result is sent with ``"edit_origin"`` or ``"send"``.
+        :type respond: str
+        """
+        name = name or callback.__name__
+        if executor is not None:
+            self._component_handlers[name] = offloaded(self.executors, callback, executor, respond)
+        else:
+            self._component_handlers[name] = callback
+        return callback
+
+    def add_component_callback(
+        self, callback, *, executor: Union[str, Executor] = None, respond: str = "edit_origin", **kwargs
+    ):
+        """
+        Refer :meth:`discord_slash.SlashCommand.add_component_callback`.
+        With ``executor`` the sync callback runs off the event loop, see :meth:`add_callback`.
+        """
+        if executor is not None:
+            callback = offloaded(self.executors, callback, executor, respond)
+        return super().add_component_callback(callback, **kwargs)
+
+    def component_callback(
+        self, *, executor: Union[str, Executor] = None, respond: str = "edit_origin", **kwargs
+    ):
+        """
+        Refer :meth:`discord_slash.SlashCommand.component_callback`. Accepts ``executor`` and ``respond`` too.
+        With ``executor`` the decorated function is left as it is, so it stays picklable for process pools.
+        """
+
+        def wrapper(callback):
+            if executor is None:
+                return self.add_component_callback(callback, **kwargs)
+            self.add_component_callback(
+                offloaded(self.executors, callback, executor, respond, check=False), **kwargs
+            )
+            return callback
+
+        return wrapper
+
+    def component_handler(
+        self, name: str = None, *, executor: Union[str, Executor] = None, respond: str = "edit_origin"
+    ):
+        """
+        Decorator version of :meth:`add_component_handler`.
+
+        Example:
+
+        .. code-block:: python
+
+            @slash.component_handler()
+            async def vote(ctx, poll_id: int, option: str):
+                ...
+
+            Button(label="Yes", custom_id=slash.encode_custom_id("vote", 42, "yes"))
+        """
+
+        def wrapper(callback):
+            if executor is None:
+                return self.add_component_handler(callback, name=name)
+            self._component_handlers[name or callback.__name__] = offloaded(
+                self.executors, callback, executor, respond, check=False
+            )
+            return callback
+
+        return wrapper
+
+    def encode_custom_id(self, handler: str, *args) -> str:
+        """Encodes handler name and its arguments with :attr:`codec`."""
+        if self.codec is None:
+            raise error.IncorrectFormat("Codec is not set!")
+        return self.codec.encode(handler, *args)
+
+    async def _invoke_component_handler(self, ctx: ComponentContext):
+        try:
+            name, args = self.codec.decode(ctx.custom_id)
+        except InvalidCustomId as ex:
+            self.logger.warning(f"Ignoring custom id {ctx.custom_id!r}: {ex}")
+            return
+
+        handler = self._component_handlers.get(name)
+        if handler is None:
+            self.logger.warning(f"No component handler named {name!r}.")
+            return
+        await handler(ctx, *args)
@@ -0,0 +1,171 @@
+import base64
+import hashlib
+import hmac
+import struct
+from typing import Any, Optional, Tuple, Union
+
+from discord_slash import error
+
+MAX_CUSTOM_ID_LENGTH = 100
+PREFIX = "~"
+VERSION = 1
+
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _BYTES = range(7)
+_DOUBLE = struct.Struct(">d")
+
+
+class InvalidCustomId(error.SlashCommandError):
+    """
+    Custom id couldn't be decoded: it is malformed, has an unknown version or a wrong signature.
+    """
+
+
+def _write_varint(buffer: bytearray, value: int):
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, offset
+        shift += 7
+
+
+class CustomIdCodec:
+    """
+    Packs a handler name and its arguments into a component ``custom_id``.
+
+    Arguments are packed into bytes and encoded with base85 behind a version prefix.
+    If ``secret`` is set, a truncated HMAC-SHA256 is appended so that users can't forge or alter ids.
+    Supported argument types are ``None``, :class:`bool`, :class:`int`, :class:`float`, :class:`str` and :class:`bytes`.
+
+    :param secret: Key for signing ids. Ids are not signed if it is ``None``.
+    :type secret: Optional[Union[str, bytes]]
+    :param signature_size: Length of the signature in bytes, from 1 to 32.
+    :type signature_size: int
+    """
+
+    def __init__(self, secret: Optional[Union[str, bytes]] = None, *, signature_size: int = 8):
+        if isinstance(secret, str):
+            secret = secret.encode()
+        if secret and not 1 <= signature_size <= hashlib.sha256().digest_size:
+            raise error.IncorrectFormat("signature_size must be from 1 to 32 when a secret is set!")
+        self.secret = secret
+        self.signature_size = signature_size if secret else 0
+        self._prefix = f"{PREFIX}{VERSION}"
+
+    def is_encoded(self, custom_id: str) -> bool:
+        return custom_id.startswith(self._prefix)
+
+    def _sign(self, body: bytes) -> bytes:
+        return hmac.new(self.secret, body, hashlib.sha256).digest()[: self.signature_size]
+
+    def encode(self, handler: str, *args: Any) -> str:
+        """
+        Encodes ``handler`` and ``args`` into a custom id.
+
+        :raises: :class:`discord_slash.error.IncorrectFormat` if an argument type is not supported
+            or the result doesn't fit into a custom id.
+        """
+        body = bytearray()
+        name = handler.encode()
+        if len(name) > 0xFF:
+            raise error.IncorrectFormat("Handler name is too long!")
+        body.append(len(name))
+        body += name
+
+        for arg in args:
+            if arg is None:
+                body.append(_NONE)
+            elif arg is True:
+                body.append(_TRUE)
+            elif arg is False:
+                body.append(_FALSE)
+            elif isinstance(arg, int):
+                body.append(_INT)
+                _write_varint(body, arg << 1 if arg >= 0 else ((-arg) << 1) - 1)
+            elif isinstance(arg, float):
+                body.append(_FLOAT)
+                body += _DOUBLE.pack(arg)
+            elif isinstance(arg, (str, bytes)):
+                raw = arg.encode() if isinstance(arg, str) else arg
+                body.append(_STR if isinstance(arg, str) else _BYTES)
+                _write_varint(body, len(raw))
+                body += raw
+            else:
+                raise error.IncorrectFormat(f"Can't encode argument of type {type(arg).__name__}!")
+
+        if self.secret:
+            body += self._sign(bytes(body))
+
+        custom_id = self._prefix + base64.b85encode(bytes(body)).decode()
+        if len(custom_id) > MAX_CUSTOM_ID_LENGTH:
+            raise error.IncorrectFormat(
+                f"Encoded custom id is {len(custom_id)} characters long, maximum is {MAX_CUSTOM_ID_LENGTH}."
+            )
+        return custom_id
+
+    def decode(self, custom_id: str) -> Tuple[str, tuple]:
+        """
+        Decodes a custom id made by :meth:`encode`.
+
+        :return: Tuple of the handler name and its arguments.
+        :raises: :class:`InvalidCustomId`
+        """
+        if not self.is_encoded(custom_id):
+            raise InvalidCustomId("Custom id wasn't made by this codec.")
+        try:
+            data = base64.b85decode(custom_id[len(self._prefix) :])
+        except ValueError:
+            raise InvalidCustomId("Custom id is malformed.") from None
+
+        if self.secret:
+            data, signature = data[: -self.signature_size], data[-self.signature_size :]
+            if not hmac.compare_digest(signature, self._sign(data)):
+                raise InvalidCustomId("Custom id has wrong signature.")
+
+        try:
+            return self._unpack(data)
+        except (IndexError, struct.error, UnicodeDecodeError):
+            raise InvalidCustomId("Custom id is malformed.") from None
+
+    def _unpack(self, data: bytes) -> Tuple[str, tuple]:
+        size = data[0]
+        offset = 1 + size
+        if len(data) < offset:
+            raise IndexError
+        handler = data[1:offset].decode()
+
+        args = []
+        while offset < len(data):
+            tag = data[offset]
+            offset += 1
+            if tag == _NONE:
+                args.append(None)
+            elif tag == _TRUE:
+                args.append(True)
+            elif tag == _FALSE:
+                args.append(False)
+            elif tag == _INT:
+                value, offset = _read_varint(data, offset)
+                args.append(value >> 1 if not value & 1 else -((value + 1) >> 1))
+            elif tag == _FLOAT:
+                args.append(_DOUBLE.unpack_from(data, offset)[0])
+                offset += _DOUBLE.size
+            elif tag in (_STR, _BYTES):
+                size, offset = _read_varint(data, offset)
+                raw = data[offset : offset + size]
+                if len(raw) != size:
+                    raise IndexError
+                offset += size
+                args.append(raw.decode() if tag == _STR else raw)
+            else:
+                raise IndexError
+        return handler, tuple(args)
@@ -1,17 +1,20 @@
-from typing import List, Union
+import copy
+from collections import OrderedDict
+from typing import TYPE_CHECKING, List, Optional, Union
 
 import discord
 from discord.ext import commands
 from discord_slash import error, http
-from discord_slash.context import (
-    InteractionContext,
-    ComponentContext as _ComponentContext
-    )
-from discord_components import Component, ActionRow
-from discord_components.utils import _get_components_json
+from discord_slash.context import ComponentContext as _ComponentContext
+from discord_slash.context import InteractionContext
 
 from .dpy_overrides import ComponentMessage
+from .handles import token_expiry
 from .model import SlashMessage
+from .utils import _get_components_json
+
+if TYPE_CHECKING:
+    from discord_components import Component, ActionRow
 
 
 async def send(
@@ -26,7 +29,7 @@ async def send(
     allowed_mentions: discord.AllowedMentions = None,
     hidden: bool = False,
     delete_after: float = None,
-    components: List[Union[ActionRow, Component, List[Component]]] = None,
+    components: List[Union["ActionRow", "Component", List["Component"]]] = None,
 ) -> SlashMessage:
     """
     Sends response of the interaction.
@@ -126,6 +129,7 @@ async def send(
             channel=self.channel or discord.Object(id=self.channel_id),
             _http=self._http,
             interaction_token=self._token,
+            expires_at=token_expiry(self.interaction_id),
         )
         if delete_after:
             self.bot.loop.create_task(smsg.delete(delay=delete_after))
@@ -135,9 +139,142 @@ async def send(
     else:
         return resp
 
-InteractionContext.send = send
+
+_UNKNOWN = object()
+
+
+def _fingerprint(rows: List[dict]) -> int:
+    """Hash of the fields of components which Discord echoes back unchanged."""
+    return hash(
+        tuple(
+            (
+                c.get("type"),
+                c.get("custom_id"),
+                c.get("url"),
+                c.get("label"),
+                c.get("style"),
+                bool(c.get("disabled")),
+                c.get("placeholder"),
+                tuple(o.get("value") for o in c.get("options", ())),
+                tuple((c.get("emoji") or {}).get(key) for key in ("id", "name")),
+            )
+            for row in rows
+            for c in row.get("components", ())
+        )
+    )
+
+
+def _copy_components(rows: List["ActionRow"]) -> List["ActionRow"]:
+    """Copies rows and their components, without parsing them again."""
+    from discord_components import ActionRow
+
+    components = []
+    for row in rows:
+        components.append(ActionRow())
+        for component in row.components:
+            components[-1].append(copy.copy(component))
+    return components
+
+
+class OriginMessageCache:
+    """
+    Bounded LRU cache of parsed origin messages, keyed by message id.
+
+    A cached message is reused while the interaction payload has the same ``edited_timestamp``
+    and content. After :meth:`ComponentContext.edit_origin` the message is updated in place
+    and validated by the hash of its components until the next payload brings the new timestamp.
+    Every context gets a shallow copy of the cached message with shallow copies of its components,
+    so changing them in place doesn't leak into other contexts.
+
+    :param maxsize: Maximum number of cached messages. ``0`` disables the cache.
+    :type maxsize: int
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._messages = OrderedDict()
+
+    def __len__(self):
+        return len(self._messages)
+
+    def get(self, data: dict) -> Optional[ComponentMessage]:
+        message_id = int(data["id"])
+        entry = self._messages.get(message_id)
+        if entry is None:
+            return None
+
+        edited_timestamp = data.get("edited_timestamp")
+        if entry["content"] != data.get("content"):
+            valid = False
+        elif entry["edited_timestamp"] is _UNKNOWN:
+            valid = entry["fingerprint"] == _fingerprint(data.get("components", []))
+        else:
+            valid = entry["edited_timestamp"] == edited_timestamp
+        if not valid:
+            del self._messages[message_id]
+            return None
+
+        if entry["edited_timestamp"] is _UNKNOWN:
+            entry["edited_timestamp"] = edited_timestamp
+            entry["message"]._edited_timestamp = discord.utils.parse_time(edited_timestamp)
+        self._messages.move_to_end(message_id)
+
+        cached = entry["message"]
+        if cached.components is None:
+            cached.components = ComponentMessage._parse_components(entry["components"])
+        message = copy.copy(cached)
+        message.components = _copy_components(cached.components)
+        return message
+
+    def put(self, data: dict, message: ComponentMessage):
+        if self.maxsize <= 0:
+            return
+        # Keep a copy, so changes to the message of the context don't reach the cache.
+        cached = copy.copy(message)
+        cached.components = _copy_components(message.components)
+        self._messages[message.id] = {
+            "edited_timestamp": data.get("edited_timestamp"),
+            "content": data.get("content"),
+            "components": data.get("components", []),
+            "fingerprint": None,
+            "message": cached,
+        }
+        self._messages.move_to_end(message.id)
+        while len(self._messages) > self.maxsize:
+            self._messages.popitem(last=False)
+
+    def update(self, message_id: int, fields: dict):
+        """Applies an edit we have just sent to the cached message."""
+        entry = self._messages.get(message_id)
+        if entry is None:
+            return
+        message = entry["message"]
+        if "content" in fields:
+            message.content = fields["content"] or ""
+            entry["content"] = message.content
+        if "embeds" in fields:
+            message.embeds = [discord.Embed.from_dict(e) for e in fields["embeds"]]
+        if "components" in fields:
+            # Parsed on the next hit, if there is one.
+            message.components = None
+            entry["components"] = fields["components"]
+            entry["fingerprint"] = None
+        if entry["fingerprint"] is None:
+            entry["fingerprint"] = _fingerprint(entry["components"])
+        entry["edited_timestamp"] = _UNKNOWN
+
+    def discard(self, message_id: int):
+        self._messages.pop(message_id, None)
+
+    def clear(self):
+        self._messages.clear()
+
 
 class ComponentContext(_ComponentContext):
+    # Component responses go through the bridge even when the ``interaction_send`` patch is not installed.
+    send = send
+    origin_cache = OriginMessageCache()
+
     def __init__(
         self,
         _http: http.SlashCommandRequest,
@@ -147,7 +284,8 @@ class ComponentContext(_ComponentContext):
         ):
         self.custom_id = self.component_id = _json["data"]["custom_id"]
         self.component_type = _json["data"]["component_type"]
-        super().__init__(_http=_http, _json=_json, _discord=_discord, logger=logger)
+        # Skip discord-interactions' ComponentContext.__init__, it parses the origin message on every click.
+        InteractionContext.__init__(self, _http=_http, _json=_json, _discord=_discord, logger=logger)
         self.origin_message = None
         self.origin_message_id = int(_json["message"]["id"]) if "message" in _json.keys() else None
 
@@ -156,9 +294,12 @@ class ComponentContext(_ComponentContext):
         self._deferred_edit_origin = False
 
         if self.origin_message_id and (_json["message"]["flags"] & 64) != 64:
-            self.origin_message = ComponentMessage(
-                state=self.bot._connection, channel=self.channel, data=_json["message"]
-            )
+            self.origin_message = self.origin_cache.get(_json["message"])
+            if self.origin_message is None:
+                self.origin_message = ComponentMessage(
+                    state=self.bot._connection, channel=self.channel, data=_json["message"]
+                )
+                self.origin_cache.put(_json["message"], self.origin_message)
             self.message = self.origin_message
             self.component = self.message.get_component(self.custom_id)
 
@@ -260,6 +401,18 @@ class ComponentContext(_ComponentContext):
         else:
             raise error.IncorrectFormat("Already responded")
 
+        if self.origin_message is not None:
+            if files:
+                self.origin_cache.discard(self.origin_message_id)
+            else:
+                self.origin_cache.update(self.origin_message_id, _resp)
+                if "content" in _resp:
+                    self.origin_message.content = _resp["content"] or ""
+                if "embeds" in _resp:
+                    self.origin_message.embeds = [discord.Embed.from_dict(e) for e in _resp["embeds"]]
+                if "components" in _resp:
+                    self.origin_message.components = ComponentMessage._parse_components(_resp["components"])
+
         if files:
             for file in files:
                 file.close()
\ No newline at end of file
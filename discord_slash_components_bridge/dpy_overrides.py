@@ -1,4 +1,4 @@
-from typing import List, Optional, Union
+from typing import TYPE_CHECKING, List, Optional, Union
 
 import discord
 from discord import (
@@ -8,14 +8,15 @@ from discord import (
     Attachment,
     MessageFlags,
     InvalidArgument,
-    http,
     utils
 )
-from discord.abc import Messageable
 from discord.ext.commands import Context
 from discord.http import Route
-from discord_components import Component, ActionRow, _get_component_type
-from discord_components.utils import _get_components_json
+
+from .utils import _get_components_json
+
+if TYPE_CHECKING:
+    from discord_components import Component, ActionRow
 
 
 class ComponentMessage(discord.Message):
@@ -23,15 +24,20 @@ class ComponentMessage(discord.Message):
 
     def __init__(self, *, state, channel, data):
         super().__init__(state=state, channel=channel, data=data)
+        self.components: List["ActionRow"] = self._parse_components(data.get("components", []))
+
+    @staticmethod
+    def _parse_components(rows: List[dict]) -> List["ActionRow"]:
+        from discord_components import ActionRow, _get_component_type
 
         components = []
-        for i in data["components"]:
+        for i in rows:
             components.append(ActionRow())
             for j in i["components"]:
                 components[-1].append(_get_component_type(j["type"]).from_json(j))
-        self.components: List[ActionRow] = components
+        return components
 
-    def get_component(self, custom_id: str) -> Optional[Component]:
+    def get_component(self, custom_id: str) -> Optional["Component"]:
         for row in self.components:
             for component in row.components:
                 if component.custom_id == custom_id:
@@ -50,7 +56,7 @@ class ComponentMessage(discord.Message):
         suppress: bool = None,
         attachments: List[Attachment] = None,
         allowed_mentions: Optional[AllowedMentions] = None,
-        components: List[Union[ActionRow, Component, List[Component]]] = None
+        components: List[Union["ActionRow", "Component", List["Component"]]] = None
     ):
         state = self._state
         data = {}
@@ -106,13 +112,10 @@ class ComponentMessage(discord.Message):
 
 
 def new_override(cls, *args, **kwargs):
-    if isinstance(cls, discord.Message):
+    # Only messages which actually carry components pay for the subclass.
+    if cls is discord.Message and kwargs.get("data", {}).get("components"):
         return object.__new__(ComponentMessage)
-    else:
-        return object.__new__(cls)
-
-
-discord.message.Message.__new__ = new_override
+    return object.__new__(cls)
 
 
 def send_files(
@@ -209,9 +212,6 @@ def send_message(
     return self.request(r, json=payload)
 
 
-http.HTTPClient.send_files = send_files
-http.HTTPClient.send_message = send_message
-
 
 async def send(
     self,
@@ -410,7 +410,3 @@ async def fetch_message(context_or_channel, id: int) -> ComponentMessage:
     state = channel._state
     data = await state.http.get_message(channel.id, id)
     return ComponentMessage(state=state, channel=channel, data=data)
-
-
-Messageable.send = send_override
-Messageable.fetch_message = fetch_message
\ No newline at end of file
@@ -0,0 +1,221 @@
+import heapq
+import json
+import struct
+import time
+from typing import Dict, Iterator, List, Optional
+
+import discord
+from discord_slash import http
+
+from .model import _edit_payload
+
+TOKEN_LIFETIME = 15 * 60
+DISCORD_EPOCH = 1420070400000
+
+_HEADER = struct.Struct(">QQdH")
+
+
+def token_expiry(interaction_id: Optional[int] = None) -> float:
+    """
+    Unix time when the token of the interaction expires.
+    Counted from now if the interaction id is not known.
+    """
+    if interaction_id is None:
+        return time.time() + TOKEN_LIFETIME
+    return ((int(interaction_id) >> 22) + DISCORD_EPOCH) / 1000 + TOKEN_LIFETIME
+
+
+def _request(req: http.SlashCommandRequest, method: str, path: str, **kwargs):
+    route = http.CustomRoute(method, path)
+    # Use the dedicated interaction transport if the bridge has one.
+    transport = getattr(req, "transport", None)
+    if transport is not None:
+        return transport.request(route, **kwargs)
+    return req._discord.http.request(route, **kwargs)
+
+
+def _files_form(payload: dict, files: List[discord.File]) -> list:
+    form = [{"name": "payload_json", "value": json.dumps(payload)}]
+    for x, sel in enumerate(files):
+        form.append(
+            {
+                "name": f"file{x if len(files) > 1 else ''}",
+                "value": sel.fp,
+                "filename": sel.filename,
+                "content_type": "application/octet-stream",
+            }
+        )
+    return form
+
+
+class InteractionMessageHandle:
+    """
+    Compact reference to a message sent in response to an interaction.
+
+    Keeps only what the webhook routes need, so a message can be edited, deleted or
+    followed up until the interaction token expires without keeping the message object.
+    Handles can be serialized with :meth:`to_bytes` and stored in bulk in a :class:`HandleStore`.
+
+    :ivar application_id: Id of the application.
+    :ivar token: Interaction token.
+    :ivar message_id: Id of the message.
+    :ivar expires_at: Unix time when the token expires.
+    """
+
+    __slots__ = ("application_id", "token", "message_id", "expires_at")
+
+    def __init__(self, application_id: int, token: str, message_id: int, expires_at: float):
+        self.application_id = int(application_id)
+        self.token = token
+        self.message_id = int(message_id)
+        self.expires_at = expires_at
+
+    def __repr__(self):
+        return (
+            f"<InteractionMessageHandle application_id={self.application_id} "
+            f"message_id={self.message_id} expires_at={self.expires_at}>"
+        )
+
+    def __eq__(self, other):
+        return isinstance(other, InteractionMessageHandle) and self.to_tuple() == other.to_tuple()
+
+    @property
+    def expired(self) -> bool:
+        return time.time() >= self.expires_at
+
+    def to_tuple(self) -> tuple:
+        return self.application_id, self.token, self.message_id, self.expires_at
+
+    @classmethod
+    def from_tuple(cls, data: tuple) -> "InteractionMessageHandle":
+        return cls(*data)
+
+    def to_bytes(self) -> bytes:
+        token = self.token.encode()
+        return _HEADER.pack(self.application_id, self.message_id, self.expires_at, len(token)) + token
+
+    @classmethod
+    def from_bytes(cls, data: bytes, offset: int = 0) -> "InteractionMessageHandle":
+        return cls._unpack(data, offset)[0]
+
+    @classmethod
+    def _unpack(cls, data: bytes, offset: int):
+        application_id, message_id, expires_at, size = _HEADER.unpack_from(data, offset)
+        offset += _HEADER.size
+        token = bytes(data[offset : offset + size]).decode()
+        return cls(application_id, token, message_id, expires_at), offset + size
+
+    def _path(self, message_id=None) -> str:
+        path = f"/webhooks/{self.application_id}/{self.token}"
+        if message_id is not None:
+            path += f"/messages/{message_id}"
+        return path
+
+    async def _send(self, req, method: str, path: str, fields: dict, extra: dict = None):
+        _resp, files = _edit_payload(fields, req._discord.allowed_mentions)
+        if extra:
+            _resp.update(extra)
+        try:
+            if files:
+                return await _request(req, method, path, form=_files_form(_resp, files), files=files)
+            return await _request(req, method, path, json=_resp)
+        finally:
+            if files:
+                for file in files:
+                    file.close()
+
+    async def edit(self, req: http.SlashCommandRequest, **fields):
+        """
+        Edits the message. Refer :meth:`SlashMessage.edit` for fields.
+
+        :param req: ``SlashCommand.req`` of the bridge.
+        """
+        await self._send(req, "PATCH", self._path(self.message_id), fields)
+
+    async def delete(self, req: http.SlashCommandRequest):
+        """Deletes the message."""
+        await _request(req, "DELETE", self._path(self.message_id))
+
+    async def followup(self, req: http.SlashCommandRequest, *, hidden: bool = False, **fields) -> "InteractionMessageHandle":
+        """
+        Sends a followup message to the interaction. Refer :meth:`InteractionContext.send` for fields.
+
+        :return: Handle of the new message.
+        """
+        data = await self._send(req, "POST", self._path(), fields, {"flags": 64} if hidden else None)
+        return InteractionMessageHandle(self.application_id, self.token, data["id"], self.expires_at)
+
+
+class HandleStore:
+    """
+    Handles by message id. Expired handles are dropped automatically.
+
+    Example:
+
+    .. code-block:: python
+
+        store = HandleStore()
+        store.add(message.to_handle())
+        ...
+        handle = store.get(message_id)
+        if handle is not None:
+            await handle.edit(slash.req, content="Done!")
+    """
+
+    def __init__(self):
+        self._handles: Dict[int, InteractionMessageHandle] = {}
+        self._expiry = []
+
+    def __len__(self):
+        self.purge()
+        return len(self._handles)
+
+    def __iter__(self) -> Iterator[InteractionMessageHandle]:
+        self.purge()
+        return iter(list(self._handles.values()))
+
+    def add(self, handle: InteractionMessageHandle):
+        self.purge()
+        if handle.expired:
+            return
+        self._handles[handle.message_id] = handle
+        heapq.heappush(self._expiry, (handle.expires_at, handle.message_id))
+
+    def get(self, message_id: int) -> Optional[InteractionMessageHandle]:
+        handle = self._handles.get(message_id)
+        if handle is not None and handle.expired:
+            self.purge()
+            return None
+        return handle
+
+    def remove(self, message_id: int) -> Optional[InteractionMessageHandle]:
+        # The heap entry is left behind and skipped by purge.
+        return self._handles.pop(message_id, None)
+
+    def purge(self) -> int:
+        """Drops expired handles and returns how many were dropped."""
+        now = time.time()
+        dropped = 0
+        while self._expiry and self._expiry[0][0] <= now:
+            expires_at, message_id = heapq.heappop(self._expiry)
+            handle = self._handles.get(message_id)
+            if handle is not None and handle.expires_at == expires_at:
+                del self._handles[message_id]
+                dropped += 1
+        return dropped
+
+    def dumps(self) -> bytes:
+        """Serializes the alive handles."""
+        self.purge()
+        return b"".join(handle.to_bytes() for handle in self._handles.values())
+
+    @classmethod
+    def loads(cls, data: bytes) -> "HandleStore":
+        """Restores a store from :meth:`dumps`. Handles expired in the meantime are skipped."""
+        store = cls()
+        view = memoryview(data)
+        offset = 0
+        while offset < len(view):
+            handle, offset = InteractionMessageHandle._unpack(view, offset)
+            store.add(handle)
+        return store
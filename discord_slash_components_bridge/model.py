@@ -1,93 +1,129 @@
 import asyncio
 from contextlib import suppress
+from typing import Optional
 
 import discord
 from discord_slash import http, error
-from discord_components.utils import _get_components_json
 
 from .dpy_overrides import ComponentMessage
+from .utils import _get_components_json
+
+
+def _edit_payload(fields: dict, default_allowed_mentions: Optional[discord.AllowedMentions]):
+    """
+    Builds the payload of a webhook message edit from ``edit`` fields.
+
+    :return: Tuple of the payload and the files to upload.
+    """
+    _resp = {}
+
+    try:
+        content = fields["content"]
+    except KeyError:
+        pass
+    else:
+        if content is not None:
+            content = str(content)
+        _resp["content"] = content
+
+    try:
+        components = fields["components"]
+    except KeyError:
+        pass
+    else:
+        if components is None:
+            _resp["components"] = []
+        else:
+            _resp["components"] = _get_components_json(components)
+
+    try:
+        embeds = fields["embeds"]
+    except KeyError:
+        # Nope
+        pass
+    else:
+        if not isinstance(embeds, list):
+            raise error.IncorrectFormat("Provide a list of embeds.")
+        if len(embeds) > 10:
+            raise error.IncorrectFormat("Do not provide more than 10 embeds.")
+        _resp["embeds"] = [e.to_dict() for e in embeds]
+
+    try:
+        embed = fields["embed"]
+    except KeyError:
+        pass
+    else:
+        if "embeds" in _resp:
+            raise error.IncorrectFormat("You can't use both `embed` and `embeds`!")
+
+        if embed is None:
+            _resp["embeds"] = []
+        else:
+            _resp["embeds"] = [embed.to_dict()]
+
+    file = fields.get("file")
+    files = fields.get("files")
+
+    if files is not None and file is not None:
+        raise error.IncorrectFormat("You can't use both `file` and `files`!")
+    if file:
+        files = [file]
+
+    allowed_mentions = fields.get("allowed_mentions")
+    if allowed_mentions is not None:
+        if default_allowed_mentions is not None:
+            _resp["allowed_mentions"] = default_allowed_mentions.merge(
+                allowed_mentions
+            ).to_dict()
+        else:
+            _resp["allowed_mentions"] = allowed_mentions.to_dict()
+    else:
+        if default_allowed_mentions is not None:
+            _resp["allowed_mentions"] = default_allowed_mentions.to_dict()
+        else:
+            _resp["allowed_mentions"] = {}
+
+    return _resp, files
 
 
 class SlashMessage(ComponentMessage):
     """discord.py's :class:`discord.Message` but overridden ``edit`` and ``delete`` to work for slash command."""
 
-    def __init__(self, *, state, channel, data, _http: http.SlashCommandRequest, interaction_token):
+    def __init__(
+        self,
+        *,
+        state,
+        channel,
+        data,
+        _http: http.SlashCommandRequest,
+        interaction_token,
+        expires_at: Optional[float] = None
+    ):
         # Yes I know it isn't the best way but this makes implementation simple.
         super().__init__(state=state, channel=channel, data=data)
         self._http = _http
         self.__interaction_token = interaction_token
+        self._expires_at = expires_at
 
-    async def _slash_edit(self, **fields):
+    def to_handle(self):
         """
-        An internal function
+        Returns a compact :class:`InteractionMessageHandle` which can edit, delete and follow up
+        this message without keeping the message object.
         """
-        _resp = {}
-
-        try:
-            content = fields["content"]
-        except KeyError:
-            pass
-        else:
-            if content is not None:
-                content = str(content)
-            _resp["content"] = content
-
-        try:
-            components = fields["components"]
-        except KeyError:
-            pass
-        else:
-            if components is None:
-                _resp["components"] = []
-            else:
-                _resp["components"] = _get_components_json(components)
+        from .handles import InteractionMessageHandle, token_expiry
 
-        try:
-            embeds = fields["embeds"]
-        except KeyError:
-            # Nope
-            pass
-        else:
-            if not isinstance(embeds, list):
-                raise error.IncorrectFormat("Provide a list of embeds.")
-            if len(embeds) > 10:
-                raise error.IncorrectFormat("Do not provide more than 10 embeds.")
-            _resp["embeds"] = [e.to_dict() for e in embeds]
+        return InteractionMessageHandle(
+            self._http.application_id,
+            self.__interaction_token,
+            self.id,
+            self._expires_at or token_expiry(),
+        )
 
-        try:
-            embed = fields["embed"]
-        except KeyError:
-            pass
-        else:
-            if "embeds" in _resp:
-                raise error.IncorrectFormat("You can't use both `embed` and `embeds`!")
-
-            if embed is None:
-                _resp["embeds"] = []
-            else:
-                _resp["embeds"] = [embed.to_dict()]
-
-        file = fields.get("file")
-        files = fields.get("files")
-
-        if files is not None and file is not None:
-            raise error.IncorrectFormat("You can't use both `file` and `files`!")
-        if file:
-            files = [file]
-
-        allowed_mentions = fields.get("allowed_mentions")
-        if allowed_mentions is not None:
-            if self._state.allowed_mentions is not None:
-                _resp["allowed_mentions"] = self._state.allowed_mentions.merge(
-                    allowed_mentions
-                ).to_dict()
-            else:
-                _resp["allowed_mentions"] = allowed_mentions.to_dict()
-        else:
-            if self._state.allowed_mentions is not None:
-                _resp["allowed_mentions"] = self._state.allowed_mentions.to_dict()
-            else:
-                _resp["allowed_mentions"] = {}
+    async def _slash_edit(self, **fields):
+        """
+        An internal function
+        """
+        _resp, files = _edit_payload(fields, self._state.allowed_mentions)
 
         await self._http.edit(_resp, self.__interaction_token, self.id, files=files)
 
@@ -0,0 +1,147 @@
+import asyncio
+import functools
+import io
+import pickle
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Optional, Union
+
+import discord
+from discord_slash import error
+
+RESPONSES = ("edit_origin", "send")
+
+
+def component_snapshot(ctx) -> dict:
+    """Picklable data of the interaction which is passed to offloaded callbacks."""
+    return {
+        "custom_id": ctx.custom_id,
+        "component_type": ctx.component_type,
+        "selected_options": ctx.selected_options,
+        "origin_message_id": ctx.origin_message_id,
+        "author_id": ctx.author_id,
+        "channel_id": ctx.channel_id,
+        "guild_id": ctx.guild_id,
+    }
+
+
+def _to_file(value) -> discord.File:
+    if isinstance(value, tuple):
+        filename, data = value
+        return discord.File(io.BytesIO(data), filename=filename)
+    return value
+
+
+def _prepare_response(result: dict) -> dict:
+    fields = dict(result)
+    if "file" in fields:
+        fields["file"] = _to_file(fields["file"])
+    if "files" in fields:
+        fields["files"] = [_to_file(f) for f in fields["files"]]
+    return fields
+
+
+class ExecutorPool:
+    """
+    Executors shared by offloaded callbacks of a :class:`SlashCommand`.
+    ``"thread"`` and ``"process"`` pools are created on first use.
+    """
+
+    def __init__(self):
+        self._executors = {}
+
+    def get(self, executor: Union[str, Executor]) -> Executor:
+        if isinstance(executor, Executor):
+            pool = executor
+        elif executor in ("thread", "process"):
+            pool = self._executors.get(executor)
+            if pool is None:
+                pool = ThreadPoolExecutor() if executor == "thread" else ProcessPoolExecutor()
+                self._executors[executor] = pool
+        else:
+            raise error.IncorrectFormat("executor must be \"thread\", \"process\" or an Executor!")
+        return pool
+
+    @staticmethod
+    def check(pool: Executor, func: Callable):
+        """Raises :class:`IncorrectFormat` if ``func`` can't be sent to the process ``pool``."""
+        if isinstance(pool, ProcessPoolExecutor):
+            try:
+                pickle.dumps(func)
+            except (pickle.PicklingError, AttributeError, TypeError) as ex:
+                raise error.IncorrectFormat(
+                    f"Callback {func!r} must be picklable to run in a process pool: {ex}"
+                ) from None
+
+    def shutdown(self, wait: bool = True):
+        for pool in self._executors.values():
+            pool.shutdown(wait=wait)
+        self._executors.clear()
+
+
+async def run_offloaded(
+    ctx,
+    func: Callable,
+    executor: Executor,
+    *args,
+    respond: str = "edit_origin",
+    defer_after: Optional[float] = 2.0,
+):
+    """
+    Runs ``func(snapshot, *args)`` in ``executor`` and responds with its result on the event loop.
+
+    The interaction is deferred if the result is not ready after ``defer_after`` seconds.
+    The result is ``None`` (the interaction is only acknowledged) or a dict of keyword arguments
+    of ``ctx.send`` or ``ctx.edit_origin``. ``file`` and ``files`` may hold ``(filename, bytes)``
+    tuples, which is the way to return files from a process pool.
+    """
+    loop = asyncio.get_event_loop()
+    future = loop.run_in_executor(executor, functools.partial(func, component_snapshot(ctx), *args))
+
+    try:
+        result = await asyncio.wait_for(asyncio.shield(future), defer_after)
+    except asyncio.TimeoutError:
+        if not ctx.responded and not ctx.deferred:
+            await ctx.defer(edit_origin=respond == "edit_origin")
+        result = await future
+
+    if result is not None:
+        await getattr(ctx, respond)(**_prepare_response(result))
+    elif not ctx.responded and not ctx.deferred:
+        # Acknowledge the interaction, otherwise Discord shows it as failed.
+        await ctx.defer(edit_origin=respond == "edit_origin")
+
+
+def offloaded(
+    pool: ExecutorPool,
+    func: Callable,
+    executor: Union[str, Executor],
+    respond: str = "edit_origin",
+    defer_after: Optional[float] = 2.0,
+    *,
+    check: bool = True,
+):
+    """
+    Wraps sync ``func`` into a coroutine callback which runs it with :func:`run_offloaded`.
+
+    ``func`` is checked to be picklable for process pools right away, or on the first call
+    if ``check`` is ``False``. Decorators pass ``False``, since the function they get is
+    not bound to its module-level name yet.
+    """
+    if respond not in RESPONSES:
+        raise error.IncorrectFormat(f"respond must be one of {', '.join(RESPONSES)}!")
+    pool_executor = pool.get(executor)
+    checked = check
+    if check:
+        pool.check(pool_executor, func)
+
+    @functools.wraps(func)
+    async def wrapper(ctx, *args):
+        nonlocal checked
+        if not checked:
+            pool.check(pool_executor, func)
+            checked = True
+        await run_offloaded(
+            ctx, func, pool_executor, *args, respond=respond, defer_after=defer_after
+        )
+
+    return wrapper
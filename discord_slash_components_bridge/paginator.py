@@ -0,0 +1,281 @@
+import asyncio
+import inspect
+import itertools
+from collections import OrderedDict, deque
+from collections.abc import Sequence
+from typing import Any, Callable, List, Optional
+
+import discord
+from discord_slash import error
+
+from .utils import _get_components_json
+
+CUSTOM_ID_PREFIX = "bridge.paginator:"
+FIRST, PREVIOUS, NEXT, LAST = "first", "previous", "next", "last"
+
+_instances = itertools.count()
+
+
+class PageSource:
+    """
+    Splits a source of items into pages and pulls the items only when a page is requested.
+
+    Items pulled from an iterator are kept only for the last ``window`` pages,
+    pages before them can't be shown anymore.
+
+    :param source: List, iterable, generator or async iterator of items.
+    :param per_page: Number of items on a page.
+    :type per_page: int
+    :param window: Number of pages of pulled items kept in memory. At least ``2``.
+    :type window: int
+    """
+
+    def __init__(self, source, per_page: int = 1, *, window: int = 8):
+        # The paginator pulls the second page before it renders the first one.
+        if window < 2:
+            raise error.IncorrectFormat("window must be at least 2!")
+        self.per_page = per_page
+        self._async = False
+        self._pulled = 0
+        if isinstance(source, Sequence):
+            self._items = source
+            self._iterator = None
+        else:
+            self._items = deque(maxlen=window * per_page)
+            if hasattr(source, "__aiter__"):
+                self._iterator = source.__aiter__()
+                self._async = True
+            else:
+                self._iterator = iter(source)
+
+    @property
+    def exhausted(self) -> bool:
+        return self._iterator is None
+
+    @property
+    def page_count(self) -> Optional[int]:
+        """Number of pages, or ``None`` if the source isn't exhausted yet."""
+        if not self.exhausted:
+            return None
+        return max(1, -(-self._count() // self.per_page))
+
+    def _count(self) -> int:
+        """Number of items pulled so far, including dropped ones."""
+        return self._pulled if isinstance(self._items, deque) else len(self._items)
+
+    async def _fill(self, count: Optional[int]):
+        while self._iterator is not None and (count is None or self._pulled < count):
+            try:
+                if self._async:
+                    item = await self._iterator.__anext__()
+                else:
+                    item = next(self._iterator)
+            except (StopIteration, StopAsyncIteration):
+                self._iterator = None
+            else:
+                self._items.append(item)
+                self._pulled += 1
+
+    async def get_page(self, index: int) -> Optional[List[Any]]:
+        """Returns items of the page or ``None`` if there is no such page or it was dropped."""
+        if index < 0:
+            return None
+        start, end = index * self.per_page, (index + 1) * self.per_page
+        await self._fill(end)
+        offset = self._count() - len(self._items)
+        if start < offset:
+            return None
+        items = list(itertools.islice(self._items, start - offset, end - offset))
+        if not items and index > 0:
+            return None
+        return items
+
+    async def last_index(self) -> int:
+        """Index of the last page. Exhausts the source, keeping only the items of the last pages."""
+        await self._fill(None)
+        return self.page_count - 1
+
+
+def _default_render(items: List[Any], index: int, page_count: Optional[int]) -> str:
+    return "\n".join(str(item) for item in items) + f"\n\nPage {index + 1}/{page_count or '?'}"
+
+
+class _Session:
+    __slots__ = ("source", "render", "index", "author_id", "expires_at", "pages", "lock")
+
+    def __init__(self, source: PageSource, render: Callable, author_id: Optional[int]):
+        self.source = source
+        self.render = render
+        self.index = 0
+        self.author_id = author_id
+        self.expires_at = 0.0
+        self.pages = OrderedDict()
+        self.lock = asyncio.Lock()
+
+
+class Paginator:
+    """
+    Paginator engine which serves every paginated message of the bot.
+
+    Pages are rendered only when they are shown and the last ``cache_size`` rendered pages
+    of each message are kept. Every message of a paginator uses the same navigation buttons,
+    serialized once, and all page turns go through one handler which finds the message's state
+    by its id. Custom ids of the buttons are numbered per paginator, so several paginators
+    don't take over each other's messages.
+
+    Example:
+
+    .. code-block:: python
+
+        paginator = Paginator(slash)
+
+        @slash.slash(name="logs")
+        async def logs(ctx):
+            await paginator.send(ctx, read_log_lines(), per_page=20)
+
+    :param slash: Bridge's :class:`SlashCommand`.
+    :param cache_size: Number of rendered pages kept per message.
+    :type cache_size: int
+    :param max_sessions: Maximum number of paginated messages. The least recently used are dropped.
+    :type max_sessions: int
+    :param timeout: Seconds of inactivity after which a message stops paginating.
+    :type timeout: float
+    """
+
+    def __init__(self, slash, *, cache_size: int = 4, max_sessions: int = 1000, timeout: float = 600.0):
+        from discord_components import Button, ButtonStyle
+
+        self.slash = slash
+        self.cache_size = cache_size
+        self.max_sessions = max_sessions
+        self.timeout = timeout
+        self._sessions = OrderedDict()
+        self.custom_id_prefix = f"{CUSTOM_ID_PREFIX}{next(_instances)}:"
+
+        buttons = [
+            Button(style=ButtonStyle.gray, label=label, custom_id=self.custom_id_prefix + action)
+            for label, action in (("«", FIRST), ("‹", PREVIOUS), ("›", NEXT), ("»", LAST))
+        ]
+        self.components = _get_components_json([buttons])
+        for button in buttons:
+            slash.add_callback(button, self._on_turn)
+
+    def __len__(self):
+        return len(self._sessions)
+
+    async def _render(self, session: _Session, index: int) -> Optional[dict]:
+        cached = session.pages.get(index)
+        # Pages rendered before the page count was known are rendered again.
+        if cached is not None and cached[0] == session.source.page_count:
+            session.pages.move_to_end(index)
+            return cached[1]
+
+        items = await session.source.get_page(index)
+        if items is None:
+            # Items of the page may have been dropped, an outdated render is better than nothing.
+            return cached[1] if cached is not None else None
+        page_count = session.source.page_count
+        page = session.render(items, index, page_count)
+        if inspect.isawaitable(page):
+            page = await page
+        if isinstance(page, discord.Embed):
+            page = {"embed": page}
+        elif not isinstance(page, dict):
+            page = {"content": str(page)}
+        elif "components" in page:
+            raise error.IncorrectFormat("Pages can't set components, the paginator sets them!")
+
+        session.pages[index] = (page_count, page)
+        session.pages.move_to_end(index)
+        while len(session.pages) > self.cache_size:
+            session.pages.popitem(last=False)
+        return page
+
+    async def send(
+        self,
+        target,
+        source,
+        *,
+        per_page: int = 1,
+        render: Callable = None,
+        author_id: int = None,
+        **fields
+    ):
+        """
+        Sends the first page and starts paginating the message.
+
+        :param target: Context or channel to send to.
+        :param source: List, iterable, generator or async iterator of items, or a :class:`PageSource`.
+        :param per_page: Number of items on a page.
+        :type per_page: int
+        :param render: Sync or async function which gets items of the page, page index and page count
+            (``None`` while unknown) and returns content, an embed or a dict of message fields
+            other than ``components``.
+        :param author_id: If set, only this user can turn pages.
+        :type author_id: int
+        :param fields: Other fields of ``send``, like ``tts``. Fields of the page take precedence.
+            Hidden messages can't be paginated and components are set by the paginator.
+        :return: Sent message.
+        """
+        if fields.get("hidden"):
+            # Hidden responses don't give us a message to find the session by.
+            raise error.IncorrectFormat("Paginated messages can't be hidden!")
+        if "components" in fields:
+            raise error.IncorrectFormat("Paginated messages can't have other components!")
+        if not isinstance(source, PageSource):
+            source = PageSource(source, per_page)
+        session = _Session(source, render or _default_render, author_id)
+
+        # Pull the second page first to find out whether navigation is needed at all.
+        paginate = await source.get_page(1) is not None
+        page = await self._render(session, 0)
+
+        message = await target.send(
+            **{**fields, **page}, components=self.components if paginate else None
+        )
+        if paginate and isinstance(message, discord.Message):
+            self._register(message.id, session)
+        return message
+
+    def _register(self, message_id: int, session: _Session):
+        session.expires_at = self.slash._discord.loop.time() + self.timeout
+        self._sessions[message_id] = session
+        self._sessions.move_to_end(message_id)
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+
+    def stop(self, message_id: int) -> bool:
+        """Stops paginating the message. Its buttons stop responding."""
+        return self._sessions.pop(message_id, None) is not None
+
+    async def _on_turn(self, ctx):
+        session = self._sessions.get(ctx.origin_message_id)
+        if session is not None and session.expires_at < self.slash._discord.loop.time():
+            del self._sessions[ctx.origin_message_id]
+            session = None
+        if session is None:
+            await ctx.edit_origin(components=[])
+            return
+        if session.author_id is not None and ctx.author_id != session.author_id:
+            await ctx.defer(edit_origin=True)
+            return
+
+        action = ctx.custom_id[len(self.custom_id_prefix) :]
+        async with session.lock:
+            if action == FIRST:
+                index = 0
+            elif action == PREVIOUS:
+                index = session.index - 1
+            elif action == NEXT:
+                index = session.index + 1
+            else:
+                index = await session.source.last_index()
+
+            page = await self._render(session, index) if index != session.index else None
+            if page is None:
+                await ctx.defer(edit_origin=True)
+                return
+            session.index = index
+            self._register(ctx.origin_message_id, session)
+
+        await ctx.edit_origin(**page)
@@ -0,0 +1,133 @@
+import sys
+from typing import Iterable, Optional
+
+PATCHES = ("message", "http", "messageable", "interaction_send")
+
+_MISSING = object()
+# Attributes as they were before discord-interactions or the bridge patched them, by (owner, attr).
+_originals = {}
+
+
+def _remember(owner, attr: str, value=_MISSING):
+    _originals.setdefault((owner, attr), value)
+
+
+def _remember_discord_py():
+    import discord
+    from discord import http
+    from discord.abc import Messageable
+
+    # discord.py has no Message.__new__ of its own, every message is made by object.__new__.
+    _remember(discord.message.Message, "__new__")
+    if "discord_slash" in sys.modules:
+        # discord-interactions has already replaced the rest.
+        return
+    for owner, attr in (
+        (http.HTTPClient, "send_files"),
+        (http.HTTPClient, "send_message"),
+        (Messageable, "send"),
+    ):
+        _remember(owner, attr, vars(owner)[attr])
+
+
+def _message_targets():
+    import discord
+
+    from .dpy_overrides import new_override
+
+    return [(discord.message.Message, "__new__", new_override)]
+
+
+def _http_targets():
+    from discord import http
+
+    from .dpy_overrides import send_files, send_message
+
+    return [
+        (http.HTTPClient, "send_files", send_files),
+        (http.HTTPClient, "send_message", send_message),
+    ]
+
+
+def _messageable_targets():
+    from discord.abc import Messageable
+
+    from .dpy_overrides import send_override, fetch_message
+
+    return [
+        (Messageable, "send", send_override),
+        (Messageable, "fetch_message", fetch_message),
+    ]
+
+
+def _interaction_send_targets():
+    from discord_slash.context import InteractionContext
+
+    from .contex import send
+
+    return [(InteractionContext, "send", send)]
+
+
+_TARGETS = {
+    "message": _message_targets,
+    "http": _http_targets,
+    "messageable": _messageable_targets,
+    "interaction_send": _interaction_send_targets,
+}
+
+
+def _is_patched(value, override) -> bool:
+    return value is override or getattr(value, "__module__", "").startswith("discord_slash.")
+
+
+def install(patches: Optional[Iterable[str]] = None) -> None:
+    """
+    Installs the discord.py and discord-interactions overrides of the bridge.
+
+    Nothing is patched on import. :class:`SlashCommand` calls this with every patch by default,
+    call it yourself to select only some of them. A patch which is still in place is not applied again,
+    one which was overwritten since is applied again.
+
+    Patches which are not selected are removed, together with the ones discord-interactions
+    applies to discord.py on import. discord.py's own functions can only be restored if the bridge
+    was imported before ``discord_slash``, otherwise those of discord-interactions stay in place.
+    ``Message.__new__`` is removed in any case.
+
+    :param patches: Names of the patches to install, from :data:`PATCHES`. ``None`` installs all of them.
+    :type patches: Optional[Iterable[str]]
+    """
+    if patches is None:
+        patches = PATCHES
+    elif isinstance(patches, str):
+        patches = (patches,)
+
+    patches = tuple(patches)
+    for name in patches:
+        if name not in _TARGETS:
+            raise ValueError(f"Unknown patch {name!r}. Available patches: {', '.join(PATCHES)}")
+
+    _remember_discord_py()
+    # discord-interactions patches discord.py when it is imported,
+    # so it has to be imported before our overrides are applied.
+    import discord_slash  # noqa: F401
+
+    for name in PATCHES:
+        for owner, attr, override in _TARGETS[name]():
+            current = vars(owner).get(attr, _MISSING)
+            if name in patches:
+                if current is not override:
+                    _remember(owner, attr, current)
+                    setattr(owner, attr, override)
+                continue
+
+            original = _originals.get((owner, attr), current)
+            if original is current or not _is_patched(current, override):
+                continue
+            if original is _MISSING:
+                delattr(owner, attr)
+            else:
+                setattr(owner, attr, original)
+
+
+if "discord_slash" not in sys.modules:
+    _remember_discord_py()
@@ -0,0 +1,369 @@
+import asyncio
+import gzip
+import hashlib
+import json
+import time
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+INTERACTION_CREATE = "INTERACTION_CREATE"
+MESSAGE_CREATE = "MESSAGE_CREATE"
+
+_USER_KEYS = {"user", "author", "member", "mentions"}
+_PRIVATE_KEYS = {"username", "global_name", "nick", "email", "avatar", "banner"}
+
+
+class InteractionRecorder:
+    """
+    Writes component interactions and gateway ``MESSAGE_CREATE`` events to a gzip compressed JSONL file.
+
+    Every line is ``{"t": seconds since start, "k": kind, "d": payload}``.
+    Interaction tokens are never written. With ``anonymize`` user ids are replaced with
+    stable fake snowflakes (creation time is kept), names are hashed and message content
+    is replaced with a placeholder of the same length.
+
+    Example:
+
+    .. code-block:: python
+
+        recorder = InteractionRecorder("traffic.jsonl.gz", anonymize=True)
+        recorder.attach(slash)
+        ...
+        recorder.close()
+
+    :param path: Path of the file. Records are appended if it exists.
+    :type path: str
+    :param anonymize: Whether to anonymize user data.
+    :type anonymize: bool
+    :param salt: Salt for hashing user data. Use the same salt to keep ids stable between recordings.
+    :type salt: str
+    """
+
+    def __init__(self, path: str, *, anonymize: bool = False, salt: str = ""):
+        self.path = path
+        self.anonymize = anonymize
+        self.salt = salt.encode()
+        self.records = 0
+        self._file = gzip.open(path, "at", encoding="utf-8")
+        self._start = time.monotonic()
+        self._slash = None
+        self._message_parser = None
+
+    def attach(self, slash) -> "InteractionRecorder":
+        """
+        Starts recording interactions of ``slash`` and messages received from the gateway.
+        Messages built from HTTP responses or interaction payloads are not recorded.
+        """
+        self._slash = slash
+        slash.recorder = self
+
+        parsers = slash._discord._connection.parsers
+        parse_message_create = parsers["MESSAGE_CREATE"]
+
+        def record_message_create(data):
+            self.record(MESSAGE_CREATE, data)
+            return parse_message_create(data)
+
+        parsers["MESSAGE_CREATE"] = record_message_create
+        self._message_parser = (parse_message_create, record_message_create)
+        return self
+
+    def detach(self):
+        if self._slash is not None:
+            if self._slash.recorder is self:
+                self._slash.recorder = None
+            parsers = self._slash._discord._connection.parsers
+            original, wrapper = self._message_parser
+            if parsers.get("MESSAGE_CREATE") is wrapper:
+                parsers["MESSAGE_CREATE"] = original
+        self._slash = None
+        self._message_parser = None
+
+    def close(self):
+        self.detach()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def record(self, kind: str, payload: dict):
+        line = {"t": round(time.monotonic() - self._start, 6), "k": kind, "d": self._scrub(payload)}
+        self._file.write(json.dumps(line, separators=(",", ":")))
+        self._file.write("\n")
+        self.records += 1
+
+    def _hash(self, value: str) -> str:
+        return hashlib.blake2b(value.encode(), key=self.salt[:64], digest_size=6).hexdigest()
+
+    def _fake_snowflake(self, value: str) -> str:
+        # Keep the timestamp part, so the replay sees the same message ages.
+        snowflake = int(value)
+        noise = int(self._hash(value), 16) & 0x3FFFFF
+        return str((snowflake >> 22 << 22) | noise)
+
+    def _scrub(self, obj, user: bool = False):
+        if isinstance(obj, list):
+            return [self._scrub(x, user) for x in obj]
+        if not isinstance(obj, dict):
+            return obj
+
+        result = {}
+        for key, value in obj.items():
+            if key == "token":
+                value = "redacted"
+            elif not self.anonymize:
+                value = self._scrub(value)
+            elif key == "content" and isinstance(value, str):
+                value = "x" * len(value)
+            elif key in _PRIVATE_KEYS and isinstance(value, str):
+                value = self._hash(value)
+            elif key == "id" and user and isinstance(value, str):
+                value = self._fake_snowflake(value)
+            else:
+                value = self._scrub(value, key in _USER_KEYS or (user and key != "roles"))
+            result[key] = value
+        return result
+
+
+def read_records(path: str, kinds: Iterable[str] = None) -> Iterator[Tuple[float, str, dict]]:
+    """Yields ``(time, kind, payload)`` records of a file written by :class:`InteractionRecorder`."""
+    kinds = set(kinds) if kinds is not None else None
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if kinds is None or record["k"] in kinds:
+                yield record["t"], record["k"], record["d"]
+
+
+class ReplayReport:
+    """Result of :meth:`InteractionReplayer.run`. Latencies are in seconds."""
+
+    def __init__(self, latencies: List[float], errors: int, elapsed: float, requests: int = 0):
+        self.latencies = sorted(latencies)
+        self.errors = errors
+        self.elapsed = elapsed
+        self.requests = requests
+
+    @property
+    def events(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def throughput(self) -> float:
+        """Handled events per second."""
+        return self.events / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, q: float) -> float:
+        if not self.latencies:
+            return 0.0
+        index = min(len(self.latencies) - 1, int(round(q / 100 * (len(self.latencies) - 1))))
+        return self.latencies[index]
+
+    def __str__(self):
+        return (
+            f"{self.events} events in {self.elapsed:.2f}s ({self.throughput:.1f}/s), {self.errors} errors, "
+            f"{self.requests} HTTP requests; latency p50={self.percentile(50) * 1000:.1f}ms "
+            f"p95={self.percentile(95) * 1000:.1f}ms p99={self.percentile(99) * 1000:.1f}ms "
+            f"max={self.percentile(100) * 1000:.1f}ms"
+        )
+
+
+class InteractionReplayer:
+    """
+    Feeds a recording back through the bridge.
+
+    Interactions go to :meth:`SlashCommand._on_component` and messages to the
+    ``MESSAGE_CREATE`` parser of the client's connection state. Events are started on schedule
+    and handled concurrently, like the gateway does.
+
+    :param path: Path of the recording.
+    :type path: str
+    :param slash: Bridge's :class:`SlashCommand`.
+    :param rate: Events per second. If set, the recorded timing is ignored.
+    :type rate: Optional[float]
+    :param time_scale: Multiplier of the recorded gaps between events. ``0`` replays as fast as possible.
+    :type time_scale: float
+    :param kinds: Kinds of records to replay.
+    :type kinds: Iterable[str]
+    """
+
+    def __init__(
+        self,
+        path: str,
+        slash,
+        *,
+        rate: Optional[float] = None,
+        time_scale: float = 1.0,
+        kinds: Iterable[str] = (INTERACTION_CREATE, MESSAGE_CREATE),
+    ):
+        self.path = path
+        self.slash = slash
+        self.rate = rate
+        self.time_scale = time_scale
+        self.kinds = tuple(kinds)
+        self.errors = 0
+
+    async def _handle(self, kind: str, payload: dict, latencies: List[float]):
+        start = time.perf_counter()
+        try:
+            if kind == INTERACTION_CREATE:
+                await self.slash._on_component(payload)
+            else:
+                self.slash._discord._connection.parse_message_create(payload)
+        except Exception:
+            self.errors += 1
+            self.slash.logger.exception(f"Replaying {kind} failed")
+        latencies.append(time.perf_counter() - start)
+
+    async def run(self, server: "StubDiscordServer" = None) -> ReplayReport:
+        """
+        Replays the recording and waits until every event is handled.
+
+        :param server: Stub server to take the HTTP request count from.
+        """
+        loop = asyncio.get_event_loop()
+        latencies = []
+        tasks = []
+        self.errors = 0
+        start = loop.time()
+        first = None
+
+        for index, (t, kind, payload) in enumerate(read_records(self.path, self.kinds)):
+            if first is None:
+                first = t
+            if self.rate:
+                due = start + index / self.rate
+            else:
+                due = start + (t - first) * self.time_scale
+            delay = due - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(loop.create_task(self._handle(kind, payload, latencies)))
+
+        if tasks:
+            await asyncio.gather(*tasks)
+        return ReplayReport(
+            latencies, self.errors, loop.time() - start, server.requests if server is not None else 0
+        )
+
+
+class StubDiscordServer:
+    """
+    Local HTTP server which answers every Discord API request with a plausible response.
+
+    Use it as an async context manager and call :meth:`attach` so the client and the
+    interaction requests are sent to it instead of Discord.
+
+    :param latency: Seconds to wait before answering each request.
+    :type latency: float
+    """
+
+    def __init__(self, *, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.requests = 0
+        self._runner = None
+        self._bases = []
+        self._ids = int(time.time() * 1000 - 1420070400000) << 22
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/api/v8"
+
+    def _fake_message(self, channel_id: str, data: dict) -> dict:
+        self._ids += 1
+        return {
+            "id": str(self._ids),
+            "channel_id": channel_id,
+            "type": 0,
+            "author": {"id": "1", "username": "stub", "discriminator": "0000", "avatar": None, "bot": True},
+            "content": data.get("content") or "",
+            "embeds": data.get("embeds") or [],
+            "components": data.get("components") or [],
+            "attachments": [],
+            "mentions": [],
+            "mention_roles": [],
+            "mention_everyone": False,
+            "pinned": False,
+            "tts": False,
+            "timestamp": "2021-01-01T00:00:00+00:00",
+            "edited_timestamp": None,
+            "flags": data.get("flags", 0),
+        }
+
+    async def _handler(self, request):
+        from aiohttp import web
+
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        path = request.path
+        if request.method == "DELETE" or path.endswith("/callback"):
+            return web.Response(status=204)
+        if path.endswith("/users/@me"):
+            return self._json({"id": "1", "username": "stub", "discriminator": "0000", "avatar": None})
+
+        data = {}
+        if request.can_read_body:
+            if request.content_type == "application/json":
+                data = await request.json()
+            else:
+                form = await request.post()
+                if "payload_json" in form:
+                    data = json.loads(form["payload_json"])
+
+        parts = path.split("/")
+        channel_id = parts[parts.index("channels") + 1] if "channels" in parts else "0"
+        return self._json(self._fake_message(channel_id, data))
+
+    @staticmethod
+    def _json(data: dict):
+        from aiohttp import web
+
+        # discord.py parses only an exact "application/json", json_response() appends a charset.
+        return web.Response(body=json.dumps(data).encode(), content_type="application/json")
+
+    async def start(self):
+        from aiohttp import web
+
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self._handler)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+
+    async def attach(self, client):
+        """Routes the API requests to this server and logs ``client`` in if it is not logged in."""
+        from discord.http import Route
+        from discord_slash.http import CustomRoute
+
+        for route in (Route, CustomRoute):
+            if "BASE" in vars(route):
+                self._bases.append((route, route.BASE))
+                route.BASE = self.url
+
+        if client.http.token is None:
+            await client.http.static_login("stub", bot=True)
+
+    async def close(self):
+        for route, base in reversed(self._bases):
+            route.BASE = base
+        self._bases.clear()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
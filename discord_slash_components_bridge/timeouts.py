@@ -0,0 +1,188 @@
+import asyncio
+import heapq
+import itertools
+from contextlib import suppress
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
+
+import discord
+from discord.http import Route
+from discord_slash import error
+
+if TYPE_CHECKING:
+    from discord_components import Component
+
+
+def _has_enabled_components(rows: List[dict]) -> bool:
+    return any(not c.get("disabled") for row in rows for c in row.get("components", []))
+
+
+class ComponentTimeoutManager:
+    """
+    Disables components of registered messages when they expire.
+
+    One background task serves every message. Messages which expire together are edited
+    concurrently, at most ``concurrency`` at a time. Deleted messages and messages which were
+    edited to have no enabled components are not edited. Callbacks registered for expired and
+    deleted messages with discord-interactions are removed in the same pass. Callbacks of
+    :meth:`SlashCommand.add_callback` serve a custom id on every message, so they are removed
+    only when passed to :meth:`register`.
+
+    Example:
+
+    .. code-block:: python
+
+        timeouts = ComponentTimeoutManager(slash)
+
+        message = await ctx.send("Vote!", components=[...])
+        timeouts.register(message, 60)
+
+        button = slash.add_callback(Button(label="Ok"), on_ok)
+        message = await ctx.send("Confirm?", components=[button])
+        timeouts.register(message, 60, callbacks=[button])
+
+    :param slash: Bridge's :class:`SlashCommand`.
+    :param concurrency: Maximum number of simultaneous edits.
+    :type concurrency: int
+    :param drop_callbacks: Whether to remove callbacks of expired components.
+    :type drop_callbacks: bool
+    """
+
+    def __init__(self, slash, *, concurrency: int = 5, drop_callbacks: bool = True):
+        self.slash = slash
+        self.concurrency = concurrency
+        self.drop_callbacks = drop_callbacks
+        self._heap = []
+        self._entries = {}
+        self._counter = itertools.count()
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+        client = slash._discord
+        if hasattr(client, "add_listener"):
+            client.add_listener(self._on_raw_message_delete, "on_raw_message_delete")
+            client.add_listener(self._on_raw_bulk_message_delete, "on_raw_bulk_message_delete")
+            client.add_listener(self._on_raw_message_edit, "on_raw_message_edit")
+
+    def __len__(self):
+        return len(self._entries)
+
+    def register(self, message, timeout: float, *, callbacks: Iterable[Union[str, "Component"]] = ()):
+        """
+        Disables components of ``message`` after ``timeout`` seconds.
+        Registering the same message again replaces its timeout.
+
+        :param message: Message with components.
+        :type message: ComponentMessage
+        :param timeout: Seconds until the components are disabled.
+        :type timeout: float
+        :param callbacks: Components or custom ids whose :meth:`SlashCommand.add_callback` callbacks are
+            removed with the message. Pass only those no other message uses.
+        :type callbacks: Iterable[Union[str, Component]]
+        """
+        loop = self.slash._discord.loop
+        deadline = loop.time() + timeout
+        seq = next(self._counter)
+        rows = [row.to_dict() for row in message.components]
+        self._entries[message.id] = {
+            "seq": seq,
+            "channel_id": message.channel.id,
+            "message_id": message.id,
+            "components": rows,
+            "callbacks": [getattr(c, "custom_id", c) for c in callbacks],
+        }
+        heapq.heappush(self._heap, (deadline, seq, message.id))
+
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = loop.create_task(self._run())
+        elif self._heap[0][1] == seq:
+            # New message expires before the one the scheduler sleeps for.
+            self._wakeup.set()
+
+    def cancel(self, message_id: int) -> bool:
+        """Forgets a message without disabling its components."""
+        return self._entries.pop(message_id, None) is not None
+
+    def stop(self):
+        """Stops the scheduler. Registered messages are kept and served on the next :meth:`register`."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self):
+        loop = self.slash._discord.loop
+        semaphore = asyncio.Semaphore(self.concurrency)
+        while self._heap:
+            delay = self._heap[0][0] - loop.time()
+            if delay > 0:
+                self._wakeup.clear()
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                continue
+
+            batch = []
+            now = loop.time()
+            while self._heap and self._heap[0][0] <= now:
+                _, seq, message_id = heapq.heappop(self._heap)
+                entry = self._entries.get(message_id)
+                # Skip cancelled and re-registered messages.
+                if entry is not None and entry["seq"] == seq:
+                    del self._entries[message_id]
+                    batch.append(entry)
+
+            if batch:
+                await asyncio.gather(*(self._expire(entry, semaphore) for entry in batch))
+
+    async def _expire(self, entry: dict, semaphore: asyncio.Semaphore):
+        rows = entry["components"]
+        if _has_enabled_components(rows):
+            disabled = [
+                {**row, "components": [{**c, "disabled": True} for c in row["components"]]}
+                for row in rows
+            ]
+            route = Route(
+                "PATCH",
+                "/channels/{channel_id}/messages/{message_id}",
+                channel_id=entry["channel_id"],
+                message_id=entry["message_id"],
+            )
+            async with semaphore:
+                try:
+                    await self.slash._discord.http.request(route, json={"components": disabled})
+                except discord.NotFound:
+                    pass
+                except discord.HTTPException as ex:
+                    self.slash.logger.warning(
+                        f"Failed to disable components of message {entry['message_id']}: {ex}"
+                    )
+
+        if self.drop_callbacks:
+            self._drop_callbacks(entry)
+
+    def _drop_callbacks(self, entry: dict):
+        message_id = entry["message_id"]
+        for custom_id, by_type in list(self.slash.components.get(message_id, {}).items()):
+            for component_type in list(by_type):
+                with suppress(error.IncorrectFormat, KeyError):
+                    self.slash.remove_component_callback(message_id, custom_id, component_type)
+        for custom_id in entry["callbacks"]:
+            self.slash._components_callback.pop(custom_id, None)
+
+    def _forget_deleted(self, message_id: int):
+        entry = self._entries.pop(message_id, None)
+        if entry is not None and self.drop_callbacks:
+            self._drop_callbacks(entry)
+
+    async def _on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        self._forget_deleted(payload.message_id)
+
+    async def _on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        for message_id in payload.message_ids:
+            self._forget_deleted(message_id)
+
+    async def _on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent):
+        entry = self._entries.get(payload.message_id)
+        if entry is None or "components" not in payload.data:
+            return
+        # Disable what the message has now. If it has nothing enabled, expiry only drops callbacks.
+        entry["components"] = payload.data["components"]
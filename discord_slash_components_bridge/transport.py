@@ -0,0 +1,214 @@
+import asyncio
+import json
+import time
+from collections import namedtuple
+from typing import Callable, List, Optional
+
+import aiohttp
+import discord
+from discord import utils
+from discord.http import json_or_text
+from discord_slash import error, http
+
+RequestTiming = namedtuple("RequestTiming", "method path status elapsed new_connection")
+
+
+class InteractionTransport:
+    """
+    Dedicated HTTP session for interaction callbacks and webhook edits.
+
+    Interaction requests don't need the bot token, so they don't have to share
+    discord.py's session with bulk channel traffic. The session is created by :meth:`start`,
+    which :class:`SlashCommand` schedules when it gets a transport.
+
+    :param limit: Maximum number of simultaneous connections.
+    :type limit: int
+    :param limit_per_host: Maximum number of simultaneous connections to one host. ``0`` is unlimited.
+    :type limit_per_host: int
+    :param keepalive_timeout: Seconds to keep an idle connection open.
+    :type keepalive_timeout: float
+    :param ttl_dns_cache: Seconds to cache resolved DNS records. ``None`` caches forever.
+    :type ttl_dns_cache: Optional[int]
+    :param timeout: Total timeout of a request in seconds.
+    :type timeout: float
+    :param warmup: Number of connections to open on start.
+    :type warmup: int
+    :param max_retries: How many times a request is sent on rate limits and server errors. At least ``1``.
+    :type max_retries: int
+    """
+
+    def __init__(
+        self,
+        *,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 60.0,
+        ttl_dns_cache: Optional[int] = 300,
+        timeout: float = 10.0,
+        warmup: int = 0,
+        max_retries: int = 5,
+    ):
+        if max_retries < 1:
+            raise error.IncorrectFormat("max_retries must be at least 1!")
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.timeout = timeout
+        self.warmup_connections = warmup
+        self.max_retries = max_retries
+        self.user_agent = f"DiscordBot (https://github.com/Rapptz/discord.py {discord.__version__}) Python/aiohttp"
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._timing_hooks: List[Callable[[RequestTiming], None]] = []
+
+    def add_timing_hook(self, hook: Callable[[RequestTiming], None]):
+        """
+        Adds a function which is called with a :class:`RequestTiming` after every request.
+        ``new_connection`` is ``False`` if a pooled connection was reused.
+        """
+        self._timing_hooks.append(hook)
+        return hook
+
+    def remove_timing_hook(self, hook: Callable[[RequestTiming], None]):
+        self._timing_hooks.remove(hook)
+
+    async def _on_connection_create(self, session, ctx, params):
+        if ctx.trace_request_ctx is not None:
+            ctx.trace_request_ctx["new_connection"] = True
+
+    async def start(self):
+        """Creates the session and opens ``warmup`` connections."""
+        if self._session is not None and not self._session.closed:
+            return
+        trace = aiohttp.TraceConfig()
+        trace.on_connection_create_end.append(self._on_connection_create)
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=self.ttl_dns_cache,
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            trace_configs=[trace],
+        )
+        if self.warmup_connections:
+            await self.warmup(self.warmup_connections)
+
+    async def warmup(self, connections: int = 1) -> int:
+        """
+        Opens keep-alive connections by sending concurrent unauthenticated requests.
+
+        :return: Number of requests which succeeded.
+        """
+        route = http.CustomRoute("GET", "/gateway")
+        results = await asyncio.gather(
+            *(self.request(route) for _ in range(connections)), return_exceptions=True
+        )
+        return sum(not isinstance(result, Exception) for result in results)
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _emit_timing(self, route, status: int, start: float, trace_ctx: dict):
+        if not self._timing_hooks:
+            return
+        timing = RequestTiming(
+            route.method, route.path, status, time.perf_counter() - start, trace_ctx["new_connection"]
+        )
+        for hook in self._timing_hooks:
+            hook(timing)
+
+    async def request(self, route: http.CustomRoute, *, files: List[discord.File] = None, form: list = None, **kwargs):
+        """
+        Sends a request like :meth:`discord.http.HTTPClient.request` does, but without the bot token.
+
+        :param form: Fields of a multipart form. It is rebuilt for every retry.
+        """
+        if self._session is None or self._session.closed:
+            await self.start()
+
+        headers = {"User-Agent": self.user_agent}
+        if "json" in kwargs:
+            headers["Content-Type"] = "application/json"
+            kwargs["data"] = utils.to_json(kwargs.pop("json"))
+        kwargs["headers"] = headers
+
+        for tries in range(self.max_retries):
+            if files:
+                for f in files:
+                    f.reset(seek=tries)
+            if form:
+                form_data = aiohttp.FormData()
+                for params in form:
+                    form_data.add_field(**params)
+                kwargs["data"] = form_data
+
+            trace_ctx = {"new_connection": False}
+            start = time.perf_counter()
+            async with self._session.request(
+                route.method, route.url, trace_request_ctx=trace_ctx, **kwargs
+            ) as response:
+                data = await json_or_text(response)
+                self._emit_timing(route, response.status, start, trace_ctx)
+
+                if 300 > response.status >= 200:
+                    return data
+
+                if response.status == 429 and isinstance(data, dict):
+                    await asyncio.sleep(data.get("retry_after", 1))
+                    continue
+
+                if response.status in (500, 502, 503, 504):
+                    await asyncio.sleep(1 + tries * 2)
+                    continue
+
+                if response.status == 403:
+                    raise discord.Forbidden(response, data)
+                if response.status == 404:
+                    raise discord.NotFound(response, data)
+                raise discord.HTTPException(response, data)
+
+        raise discord.HTTPException(response, data)
+
+
+class InteractionRequest(http.SlashCommandRequest):
+    """:class:`discord_slash.http.SlashCommandRequest` which sends interaction responses through :class:`InteractionTransport`."""
+
+    def __init__(self, logger, _discord, application_id, transport: InteractionTransport):
+        super().__init__(logger, _discord, application_id)
+        self.transport = transport
+
+    def command_response(
+        self, token, use_webhook, method, interaction_id=None, url_ending="", **kwargs
+    ):
+        if not use_webhook and not interaction_id:
+            raise error.IncorrectFormat(
+                "Internal Error! interaction_id must be set if use_webhook is False"
+            )
+        req_url = (
+            f"/webhooks/{self.application_id}/{token}"
+            if use_webhook
+            else f"/interactions/{interaction_id}/{token}/callback"
+        )
+        req_url += url_ending
+        return self.transport.request(http.CustomRoute(method, req_url), **kwargs)
+
+    def request_with_files(self, _resp, files: List[discord.File], token, method, url_ending=""):
+        form = [{"name": "payload_json", "value": json.dumps(_resp)}]
+        for x, sel in enumerate(files):
+            form.append(
+                {
+                    "name": f"file{x if len(files) > 1 else ''}",
+                    "value": sel.fp,
+                    "filename": sel.filename,
+                    "content_type": "application/octet-stream",
+                }
+            )
+        return self.command_response(
+            token, True, method, form=form, files=files, url_ending=url_ending
+        )
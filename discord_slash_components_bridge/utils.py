@@ -0,0 +1,15 @@
+def _get_components_json(components=None):
+    """
+    Converts components to their JSON form.
+
+    Action rows which are already dicts are passed through, so a pre-serialized layout
+    can be sent many times without converting it again.
+    ``discord_components`` is imported on first use so that importing the bridge stays cheap
+    for processes that never send components.
+    """
+    if components and isinstance(components, list) and all(isinstance(row, dict) for row in components):
+        return components
+
+    from discord_components.utils import _get_components_json as _to_json
+
+    return _to_json(components)
@@ -30,14 +30,13 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/Damego/discord-py-slash-components-bridge",
     packages=["discord_slash_components_bridge"],
-    python_requires=">=3.6",
+    python_requires=">=3.7",
     classifiers=[
         "Intended Audience :: Developers",
         "License :: OSI Approved :: MIT License",
         "Natural Language :: English",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",